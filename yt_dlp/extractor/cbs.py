@@ -5,29 +5,37 @@
 from ..utils import (
     ExtractorError,
     extract_attributes,
-    find_xpath_attr,
     get_element_html_by_id,
     int_or_none,
     smuggle_url,
     update_url_query,
     url_or_none,
-    xpath_element,
     xpath_text,
 )
 
 
 class CBSBaseIE(ThePlatformFeedIE):  # XXX: Do not subclass from concrete IE
+    _SMIL_SUBTITLE_EXTS = {
+        'sMPTE-TTCCURL': 'tt',
+        'ClosedCaptionURL': 'ttml',
+        'webVTTCaptionURL': 'vtt',
+    }
+
     def _parse_smil_subtitles(self, smil, namespace=None, subtitles_lang='en'):
+        cc_urls = {}
+        for param in smil.iterfind(self._xpath_ns('.//param', namespace)):
+            name = param.get('name')
+            if name in self._SMIL_SUBTITLE_EXTS:
+                cc_urls.setdefault(name, param.get('value'))
+
         subtitles = {}
-        for k, ext in [('sMPTE-TTCCURL', 'tt'), ('ClosedCaptionURL', 'ttml'), ('webVTTCaptionURL', 'vtt')]:
-            cc_e = find_xpath_attr(smil, self._xpath_ns('.//param', namespace), 'name', k)
-            if cc_e is not None:
-                cc_url = cc_e.get('value')
-                if cc_url:
-                    subtitles.setdefault(subtitles_lang, []).append({
-                        'ext': ext,
-                        'url': cc_url,
-                    })
+        for k, ext in self._SMIL_SUBTITLE_EXTS.items():
+            cc_url = cc_urls.get(k)
+            if cc_url:
+                subtitles.setdefault(subtitles_lang, []).append({
+                    'ext': ext,
+                    'url': cc_url,
+                })
         return subtitles
 
     def _extract_common_video_info(self, content_id, asset_types, mpx_acc, extra_info):
@@ -132,12 +140,13 @@ def _extract_video_info(self, content_id, site='cbs', mpx_acc=2198311517):
         items_data = self._download_xml(
             'https://can.cbs.com/thunder/player/videoPlayerService.php',
             content_id, query={'partner': site, 'contentId': content_id})
-        video_data = xpath_element(items_data, './/item')
+        items = items_data.findall('.//item')
+        video_data = items[0] if items else None
         title = xpath_text(video_data, 'videoTitle', 'title') or xpath_text(video_data, 'videotitle', 'title')
 
         asset_types = {}
         has_drm = False
-        for item in items_data.findall('.//item'):
+        for item in items:
             asset_type = xpath_text(item, 'assetType')
             query = {
                 'mbr': 'true',
@@ -1,3 +1,6 @@
+import json
+import re
+
 from .common import InfoExtractor
 from ..utils import (
     js_to_json,
@@ -27,6 +30,16 @@ class EUScreenIE(InfoExtractor):
 
     _payload = b'<fsxml><screen><properties><screenId>-1</screenId></properties><capabilities id="1"><properties><platform>Win32</platform><appcodename>Mozilla</appcodename><appname>Netscape</appname><appversion>5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.71 Safari/537.36</appversion><useragent>Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.71 Safari/537.36</useragent><cookiesenabled>true</cookiesenabled><screenwidth>784</screenwidth><screenheight>758</screenheight><orientation>undefined</orientation><smt_browserid>Sat, 07 Oct 2021 08:56:50 GMT</smt_browserid><smt_sessionid>1633769810758</smt_sessionid></properties></capabilities></screen></fsxml>'
 
+    _VIDEO_JSON_RE = re.compile(r'setVideo\(({.+})\)\(\$end\$\)put')
+    _META_JSON_RE = re.compile(r'setData\(({.+})\)\(\$end\$\)')
+
+    def _parse_info_json(self, json_string, video_id):
+        # The payloads are usually valid JSON already; skip the js_to_json rewrite when they are
+        try:
+            return json.loads(json_string)
+        except json.JSONDecodeError:
+            return self._parse_json(json_string, video_id, transform_source=js_to_json)
+
     def _real_extract(self, url):
         video_id = self._match_id(url)
         args_for_js_request = self._download_webpage(
@@ -35,12 +48,10 @@ def _real_extract(self, url):
         info_js = self._download_webpage(
             'https://euscreen.eu/lou/LouServlet/domain/euscreenxl/html5application/euscreenxlitem',
             video_id, data=args_for_js_request.replace('screenid', 'screenId').encode())
-        video_json = self._parse_json(
-            self._search_regex(r'setVideo\(({.+})\)\(\$end\$\)put', info_js, 'Video JSON'),
-            video_id, transform_source=js_to_json)
-        meta_json = self._parse_json(
-            self._search_regex(r'setData\(({.+})\)\(\$end\$\)', info_js, 'Metadata JSON'),
-            video_id, transform_source=js_to_json)
+        video_json = self._parse_info_json(
+            self._search_regex(self._VIDEO_JSON_RE, info_js, 'Video JSON'), video_id)
+        meta_json = self._parse_info_json(
+            self._search_regex(self._META_JSON_RE, info_js, 'Metadata JSON'), video_id)
         formats = [{
             'url': source['src'],
         } for source in video_json.get('sources', [])]
@@ -2,7 +2,6 @@
 from ..utils import (
     ExtractorError,
     int_or_none,
-    try_get,
     url_or_none,
     urlencode_postdata,
 )
@@ -82,10 +81,11 @@ def _real_extract(self, url):
             raise ExtractorError(
                 f'{self.IE_NAME} said: {restriction}', expected=True)
 
-        formats, parsed_urls = [], {None}
+        formats, subtitles, parsed_urls = [], {}, {None}
         for rendition_id, rendition in settings['renditions'].items():
             audio, version, extra = rendition_id.split('_')
-            m3u8_url = url_or_none(try_get(rendition, lambda x: x['bitrates']['hls']))
+            bitrates = rendition.get('bitrates')
+            m3u8_url = url_or_none(bitrates.get('hls')) if isinstance(bitrates, dict) else None
             if m3u8_url not in parsed_urls:
                 parsed_urls.add(m3u8_url)
                 frmt = self._extract_m3u8_formats(
@@ -95,12 +95,17 @@ def _real_extract(self, url):
                     f['format_note'] = f'{version}, {extra}'
                 formats.extend(frmt)
 
-        subtitles = {}
-        for rendition_id, rendition in settings['renditions'].items():
-            audio, version, extra = rendition_id.split('_')
             for cc_file in rendition.get('ccFiles') or []:
-                cc_url = url_or_none(try_get(cc_file, lambda x: x[2]))
-                cc_lang = try_get(cc_file, (lambda x: x[1].replace(' ', '-').lower(), lambda x: x[0]), str)
+                # Entries without a URL at index 2 are never added
+                if not isinstance(cc_file, (list, tuple)) or len(cc_file) < 3:
+                    continue
+                cc_url = url_or_none(cc_file[2])
+                if isinstance(cc_file[1], str):
+                    cc_lang = cc_file[1].replace(' ', '-').lower()
+                elif isinstance(cc_file[0], str):
+                    cc_lang = cc_file[0]
+                else:
+                    cc_lang = None
                 if cc_url not in parsed_urls and cc_lang:
                     parsed_urls.add(cc_url)
                     subtitles.setdefault(cc_lang, []).append({'url': cc_url})
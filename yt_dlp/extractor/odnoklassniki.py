@@ -1,3 +1,4 @@
+import re
 import urllib.parse
 
 from .common import InfoExtractor
@@ -32,6 +33,11 @@ class OdnoklassnikiIE(InfoExtractor):
                     (?P<id>[\d-]+)
                 '''
     _EMBED_REGEX = [r'<iframe[^>]+src=(["\'])(?P<url>(?:https?:)?//(?:odnoklassniki|ok)\.ru/videoembed/.+?)\1']
+    _ERROR_RE = re.compile(r'[^>]+class="vp_video_stub_txt"[^>]*>([^<]+)<')
+    _MOBILE_ERROR_RE = re.compile(r'видео</a>\s*<div\s+class="empty">(.+?)</div>')
+    _MOBILE_JSON_RE = re.compile(r'data-video="(.+?)"')
+    _FORMAT_TYPE_RE = re.compile(r'\btype[/=](\d)')
+    _FROM_TIME_RE = re.compile(r'[?&]fromTime=(\d+)')
     _TESTS = [{
         'note': 'Coub embedded',
         'url': 'http://ok.ru/video/1484130554189',
@@ -252,8 +258,8 @@ def _real_extract(self, url):
                 raise e
 
     def _extract_desktop(self, url):
-        start_time = int_or_none(urllib.parse.parse_qs(
-            urllib.parse.urlparse(url).query).get('fromTime', [None])[0])
+        mobj = self._FROM_TIME_RE.search(url) if 'fromTime=' in url else None
+        start_time = int(mobj.group(1)) if mobj else None
 
         url, smuggled = unsmuggle_url(url, {})
         video_id, is_embed = self._match_valid_url(url).group('id', 'embed')
@@ -264,9 +270,7 @@ def _extract_desktop(self, url):
             note='Downloading desktop webpage',
             headers={'Referer': smuggled['referrer']} if smuggled.get('referrer') else {})
 
-        error = self._search_regex(
-            r'[^>]+class="vp_video_stub_txt"[^>]*>([^<]+)<',
-            webpage, 'error', default=None)
+        error = self._search_regex(self._ERROR_RE, webpage, 'error', default=None)
         # Direct link from boosty
         if (error == 'The author of this video has not been found or is blocked'
                 and not smuggled.get('referrer') and mode == 'videoembed'):
@@ -397,11 +401,9 @@ def _extract_desktop(self, url):
                 compat_etree_fromstring(dash_manifest), 'mpd'))
 
         for fmt in formats:
-            fmt_type = self._search_regex(
-                r'\btype[/=](\d)', fmt['url'],
-                'format type', default=None)
-            if fmt_type:
-                fmt['quality'] = quality(fmt_type)
+            mobj = self._FORMAT_TYPE_RE.search(fmt['url'])
+            if mobj:
+                fmt['quality'] = quality(mobj.group(1))
 
         # Live formats
         m3u8_url = metadata.get('hlsMasterPlaylistUrl')
@@ -432,14 +434,11 @@ def _extract_mobile(self, url):
             f'http://m.ok.ru/video/{video_id}', video_id,
             note='Downloading mobile webpage')
 
-        error = self._search_regex(
-            r'видео</a>\s*<div\s+class="empty">(.+?)</div>',
-            webpage, 'error', default=None)
+        error = self._search_regex(self._MOBILE_ERROR_RE, webpage, 'error', default=None)
         if error:
             raise ExtractorError(error, expected=True)
 
-        json_data = self._search_regex(
-            r'data-video="(.+?)"', webpage, 'json data')
+        json_data = self._search_regex(self._MOBILE_JSON_RE, webpage, 'json data')
         json_data = self._parse_json(unescapeHTML(json_data), video_id) or {}
 
         redirect_url = self._request_webpage(HEADRequest(
@@ -1,8 +1,20 @@
+import re
+
 from .common import InfoExtractor
 
 
 class OnePlacePodcastIE(InfoExtractor):
     _VALID_URL = r'https?://www\.oneplace\.com/[\w]+/[^/]+/listen/[\w-]+-(?P<id>\d+)'
+    _MEDIA_URL_RES = (
+        re.compile(r'mp3-url\s*=\s*"([^"]+)'),
+        re.compile(r'<div[^>]+id\s*=\s*"player"[^>]+data-media-url\s*=\s*"(?P<media_url>[^"]+)'),
+    )
+    _TITLE_RES = (
+        re.compile(r'<div[^>]class\s*=\s*"details"[^>]+>[^<]<h2[^>]+>(?P<content>[^>]+)>'),
+        re.compile(InfoExtractor._meta_regex('og:title')),
+        re.compile(InfoExtractor._meta_regex('title')),
+    )
+    _DESCRIPTION_RE = re.compile(r'<div[^>]+class="[^"]+epDesc"[^>]*>\s*(?P<desc>.+?)\s*</div>')
     _TESTS = [{
         'url': 'https://www.oneplace.com/ministries/a-daily-walk/listen/living-in-the-last-days-part-2-958461.html',
         'info_dict': {
@@ -27,17 +39,11 @@ def _real_extract(self, url):
 
         return {
             'id': video_id,
-            'url': self._search_regex((
-                r'mp3-url\s*=\s*"([^"]+)',
-                r'<div[^>]+id\s*=\s*"player"[^>]+data-media-url\s*=\s*"(?P<media_url>[^"]+)',
-            ), webpage, 'media url'),
+            'url': self._search_regex(self._MEDIA_URL_RES, webpage, 'media url'),
             'ext': 'mp3',
             'vcodec': 'none',
-            'title': self._html_search_regex((
-                r'<div[^>]class\s*=\s*"details"[^>]+>[^<]<h2[^>]+>(?P<content>[^>]+)>',
-                self._meta_regex('og:title'), self._meta_regex('title'),
-            ), webpage, 'title', group='content', default=None),
+            'title': self._html_search_regex(
+                self._TITLE_RES, webpage, 'title', group='content', default=None),
             'description': self._html_search_regex(
-                r'<div[^>]+class="[^"]+epDesc"[^>]*>\s*(?P<desc>.+?)\s*</div>',
-                webpage, 'description', default=None),
+                self._DESCRIPTION_RE, webpage, 'description', default=None),
         }
@@ -185,16 +185,22 @@ class ParamountPlusSeriesIE(InfoExtractor):
         },
     }]
 
+    _PAGE_SIZE = 50
+
     def _entries(self, show_name):
         for page in itertools.count():
             show_json = self._download_json(
-                f'https://www.paramountplus.com/shows/{show_name}/xhr/episodes/page/{page}/size/50/xs/0/season/0', show_name)
+                f'https://www.paramountplus.com/shows/{show_name}/xhr/episodes/page/{page}/size/{self._PAGE_SIZE}/xs/0/season/0',
+                show_name, f'Downloading page {page + 1}')
             if not show_json.get('success'):
                 return
-            for episode in show_json['result']['data']:
+            episodes = show_json['result']['data'] or []
+            for episode in episodes:
                 yield self.url_result(
                     'https://www.paramountplus.com{}'.format(episode['url']),
                     ie=ParamountPlusIE.ie_key(), video_id=episode['content_id'])
+            if len(episodes) < self._PAGE_SIZE:
+                return
 
     def _real_extract(self, url):
         show_name = self._match_id(url)
@@ -50,7 +50,15 @@ class PodchaserIE(InfoExtractor):
     }]
 
     @staticmethod
-    def _parse_episode(episode, podcast):
+    def _extract_podcast_info(podcast):
+        return {
+            'categories': list(dict.fromkeys(traverse_obj(podcast, (('summary', None), 'categories', ..., 'text')))),
+            'tags': traverse_obj(podcast, ('tags', ..., 'text')),
+            'series': podcast.get('title'),
+        }
+
+    @staticmethod
+    def _parse_episode(episode, podcast_info):
         return {
             'id': str(episode.get('id')),
             'title': episode.get('title'),
@@ -60,15 +68,13 @@ def _parse_episode(episode, podcast):
             'duration': str_to_int(episode.get('length')),
             'timestamp': unified_timestamp(episode.get('air_date')),
             'average_rating': float_or_none(episode.get('rating')),
-            'categories': list(set(traverse_obj(podcast, (('summary', None), 'categories', ..., 'text')))),
-            'tags': traverse_obj(podcast, ('tags', ..., 'text')),
-            'series': podcast.get('title'),
+            **podcast_info,
         }
 
     def _call_api(self, path, *args, **kwargs):
         return self._download_json(f'https://api.podchaser.com/{path}', *args, **kwargs)
 
-    def _fetch_page(self, podcast_id, podcast, page):
+    def _fetch_page(self, podcast_id, podcast_info, page):
         json_response = self._call_api(
             'list/episode', podcast_id,
             headers={'Content-Type': 'application/json;charset=utf-8'},
@@ -80,18 +86,20 @@ def _fetch_page(self, podcast_id, podcast, page):
                     'podcast_id': podcast_id,
                 },
                 'options': {},
-            }).encode())
+            }, separators=(',', ':')).encode())
 
         for episode in json_response['entities']:
-            yield self._parse_episode(episode, podcast)
+            yield self._parse_episode(episode, podcast_info)
 
     def _real_extract(self, url):
         podcast_id, episode_id = self._match_valid_url(url).group('podcast_id', 'id')
         podcast = self._call_api(f'podcasts/{podcast_id}', episode_id or podcast_id)
+        # These only depend on the podcast, so compute them once for all episodes
+        podcast_info = self._extract_podcast_info(podcast)
         if not episode_id:
             return self.playlist_result(
-                OnDemandPagedList(functools.partial(self._fetch_page, podcast_id, podcast), self._PAGE_SIZE),
+                OnDemandPagedList(functools.partial(self._fetch_page, podcast_id, podcast_info), self._PAGE_SIZE),
                 str_or_none(podcast.get('id')), podcast.get('title'), podcast.get('description'))
 
         episode = self._call_api(f'episodes/{episode_id}', episode_id)
-        return self._parse_episode(episode, podcast)
+        return self._parse_episode(episode, podcast_info)
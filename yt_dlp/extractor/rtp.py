@@ -30,8 +30,13 @@ class RTPIE(InfoExtractor):
         \s*\.\s*join\(\s*(?:""|'')\s*\)\s*\)\s*\)
     ''')
 
+    _RX_PLAYER_CONFIG = re.compile(r'''(?sx)
+        var\s+f\s*=\s*(?P<f>".*?"|{[^;]+?});\s*
+        var\s+player1\s+=\s+new\s+RTPPlayer\s*\((?P<config>{(?:(?!\*/).)+?})\);(?!\s*\*/)
+    ''')
+
     def __unobfuscate(self, data, *, video_id):
-        if data.startswith('{'):
+        if data.startswith('{') and 'atob' in data:
             data = self._RX_OBFUSCATION.sub(
                 lambda m: json.dumps(
                     base64.b64decode(urllib.parse.unquote(
@@ -48,11 +53,7 @@ def _real_extract(self, url):
             'twitter:title', webpage, display_name='title', fatal=True)
 
         f, config = self._search_regex(
-            r'''(?sx)
-                var\s+f\s*=\s*(?P<f>".*?"|{[^;]+?});\s*
-                var\s+player1\s+=\s+new\s+RTPPlayer\s*\((?P<config>{(?:(?!\*/).)+?})\);(?!\s*\*/)
-            ''', webpage,
-            'player config', group=('f', 'config'))
+            self._RX_PLAYER_CONFIG, webpage, 'player config', group=('f', 'config'))
 
         f = self._parse_json(
             f, video_id,
@@ -1,3 +1,4 @@
+import functools
 import re
 import uuid
 
@@ -16,6 +17,11 @@
 class ZattooPlatformBaseIE(InfoExtractor):
     _power_guide_hash = None
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._channel_ids = {}
+
+    @functools.cached_property
     def _host_url(self):
         return 'https://%s' % (self._API_HOST if hasattr(self, '_API_HOST') else self._HOST)
 
@@ -26,13 +32,13 @@ def _real_initialize(self):
     def _perform_login(self, username, password):
         try:
             data = self._download_json(
-                f'{self._host_url()}/zapi/v2/account/login', None, 'Logging in',
+                f'{self._host_url}/zapi/v2/account/login', None, 'Logging in',
                 data=urlencode_postdata({
                     'login': username,
                     'password': password,
                     'remember': 'true',
                 }), headers={
-                    'Referer': f'{self._host_url()}/login',
+                    'Referer': f'{self._host_url}/login',
                     'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
                 })
         except ExtractorError as e:
@@ -46,11 +52,11 @@ def _perform_login(self, username, password):
 
     def _initialize_pre_login(self):
         session_token = self._download_json(
-            f'{self._host_url()}/token.json', None, 'Downloading session token')['session_token']
+            f'{self._host_url}/token.json', None, 'Downloading session token')['session_token']
 
         # Will setup appropriate cookies
         self._request_webpage(
-            f'{self._host_url()}/zapi/v3/session/hello', None,
+            f'{self._host_url}/zapi/v3/session/hello', None,
             'Opening session', data=urlencode_postdata({
                 'uuid': str(uuid.uuid4()),
                 'lang': 'en',
@@ -61,7 +67,7 @@ def _initialize_pre_login(self):
 
     def _extract_video_id_from_recording(self, recid):
         playlist = self._download_json(
-            f'{self._host_url()}/zapi/v2/playlist', recid, 'Downloading playlist')
+            f'{self._host_url}/zapi/v2/playlist', recid, 'Downloading playlist')
         try:
             return next(
                 str(item['program_id']) for item in playlist['recordings']
@@ -69,26 +75,35 @@ def _extract_video_id_from_recording(self, recid):
         except (StopIteration, KeyError):
             raise ExtractorError('Could not extract video id from recording')
 
+    def _get_channel_ids(self, video_id):
+        # The channel list only depends on the session, so reuse it across extractions
+        if self._power_guide_hash not in self._channel_ids:
+            channel_groups = self._download_json(
+                f'{self._host_url}/zapi/v2/cached/channels/{self._power_guide_hash}',
+                video_id, 'Downloading channel list',
+                query={'details': False})['channel_groups']
+            # Map both display aliases and cids to the cid; the first channel wins
+            channel_ids = {}
+            for chgrp in channel_groups:
+                for chan in chgrp['channels']:
+                    cid = chan.get('cid')
+                    if not cid:
+                        continue
+                    channel_ids.setdefault(cid, cid)
+                    if chan.get('display_alias') is not None:
+                        channel_ids.setdefault(chan['display_alias'], cid)
+            self._channel_ids[self._power_guide_hash] = channel_ids
+        return self._channel_ids[self._power_guide_hash]
+
     def _extract_cid(self, video_id, channel_name):
-        channel_groups = self._download_json(
-            f'{self._host_url()}/zapi/v2/cached/channels/{self._power_guide_hash}',
-            video_id, 'Downloading channel list',
-            query={'details': False})['channel_groups']
-        channel_list = []
-        for chgrp in channel_groups:
-            channel_list.extend(chgrp['channels'])
-        try:
-            return next(
-                chan['cid'] for chan in channel_list
-                if chan.get('cid') and (
-                    chan.get('display_alias') == channel_name
-                    or chan.get('cid') == channel_name))
-        except StopIteration:
+        cid = self._get_channel_ids(video_id).get(channel_name)
+        if not cid:
             raise ExtractorError('Could not extract channel id')
+        return cid
 
     def _extract_cid_and_video_info(self, video_id):
         data = self._download_json(
-            f'{self._host_url()}/zapi/v2/cached/program/power_details/{self._power_guide_hash}',
+            f'{self._host_url}/zapi/v2/cached/program/power_details/{self._power_guide_hash}',
             video_id,
             'Downloading video information',
             query={
@@ -120,7 +135,7 @@ def _extract_ondemand_info(self, ondemand_id):
         @returns    (ondemand_token, ondemand_type, info_dict)
         """
         data = self._download_json(
-            f'{self._host_url()}/zapi/vod/movies/{ondemand_id}',
+            f'{self._host_url}/zapi/vod/movies/{ondemand_id}',
             ondemand_id, 'Downloading ondemand information')
         info_dict = {
             'id': ondemand_id,
@@ -141,18 +156,18 @@ def _extract_formats(self, cid, video_id, record_id=None, ondemand_id=None, onde
 
         if is_live:
             postdata_common.update({'timeshift': 10800})
-            url = f'{self._host_url()}/zapi/watch/live/{cid}'
+            url = f'{self._host_url}/zapi/watch/live/{cid}'
         elif record_id:
-            url = f'{self._host_url()}/zapi/watch/recording/{record_id}'
+            url = f'{self._host_url}/zapi/watch/recording/{record_id}'
         elif ondemand_id:
             postdata_common.update({
                 'teasable_id': ondemand_id,
                 'term_token': ondemand_termtoken,
                 'teasable_type': ondemand_type,
             })
-            url = f'{self._host_url()}/zapi/watch/vod/video'
+            url = f'{self._host_url}/zapi/watch/vod/video'
         else:
-            url = f'{self._host_url()}/zapi/v3/watch/replay/{cid}/{video_id}'
+            url = f'{self._host_url}/zapi/v3/watch/replay/{cid}/{video_id}'
         formats = []
         subtitles = {}
         for stream_type in ('dash', 'hls7'):
@@ -289,7 +304,7 @@ class ZattooLiveIE(ZattooBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if ZattooIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not ZattooIE.suitable(url)
 
 
 class ZattooMoviesIE(ZattooBaseIE):
@@ -347,7 +362,7 @@ class NetPlusTVLiveIE(NetPlusTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if NetPlusTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not NetPlusTVIE.suitable(url)
 
 
 class NetPlusTVRecordingsIE(NetPlusTVBaseIE):
@@ -392,7 +407,7 @@ class MNetTVLiveIE(MNetTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if MNetTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not MNetTVIE.suitable(url)
 
 
 class MNetTVRecordingsIE(MNetTVBaseIE):
@@ -437,7 +452,7 @@ class WalyTVLiveIE(WalyTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if WalyTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not WalyTVIE.suitable(url)
 
 
 class WalyTVRecordingsIE(WalyTVBaseIE):
@@ -483,7 +498,7 @@ class BBVTVLiveIE(BBVTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if BBVTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not BBVTVIE.suitable(url)
 
 
 class BBVTVRecordingsIE(BBVTVBaseIE):
@@ -529,7 +544,7 @@ class VTXTVLiveIE(VTXTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if VTXTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not VTXTVIE.suitable(url)
 
 
 class VTXTVRecordingsIE(VTXTVBaseIE):
@@ -574,7 +589,7 @@ class GlattvisionTVLiveIE(GlattvisionTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if GlattvisionTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not GlattvisionTVIE.suitable(url)
 
 
 class GlattvisionTVRecordingsIE(GlattvisionTVBaseIE):
@@ -620,7 +635,7 @@ class SAKTVLiveIE(SAKTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if SAKTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not SAKTVIE.suitable(url)
 
 
 class SAKTVRecordingsIE(SAKTVBaseIE):
@@ -665,7 +680,7 @@ class EWETVLiveIE(EWETVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if EWETVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not EWETVIE.suitable(url)
 
 
 class EWETVRecordingsIE(EWETVBaseIE):
@@ -711,7 +726,7 @@ class QuantumTVLiveIE(QuantumTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if QuantumTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not QuantumTVIE.suitable(url)
 
 
 class QuantumTVRecordingsIE(QuantumTVBaseIE):
@@ -756,7 +771,7 @@ class OsnatelTVLiveIE(OsnatelTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if OsnatelTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not OsnatelTVIE.suitable(url)
 
 
 class OsnatelTVRecordingsIE(OsnatelTVBaseIE):
@@ -802,7 +817,7 @@ class EinsUndEinsTVLiveIE(EinsUndEinsTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if EinsUndEinsTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not EinsUndEinsTVIE.suitable(url)
 
 
 class EinsUndEinsTVRecordingsIE(EinsUndEinsTVBaseIE):
@@ -847,7 +862,7 @@ class SaltTVLiveIE(SaltTVBaseIE):
 
     @classmethod
     def suitable(cls, url):
-        return False if SaltTVIE.suitable(url) else super().suitable(url)
+        return super().suitable(url) and not SaltTVIE.suitable(url)
 
 
 class SaltTVRecordingsIE(SaltTVBaseIE):
@@ -773,6 +773,8 @@ def unescapeHTML(s):
     if s is None:
         return None
     assert isinstance(s, str)
+    if '&' not in s:
+        return s
 
     return re.sub(
         r'&([^&;]+;)', lambda m: _htmlentity_transform(m.group(1)), s)